@@ -11,13 +11,22 @@
 
 from datetime import date
 from datetime import timedelta as td
+from functools import lru_cache
 
 from dateutil.easter import easter
 
 from holidays.constants import JAN, MAR, APR, MAY, AUG, OCT, NOV, DEC
+
+# isort: split
+from holidays.constants import MON, TUE, THU
 from holidays.holiday_base import HolidayBase
 
 
+@lru_cache(maxsize=None)
+def _easter(year: int) -> date:
+    return easter(year)
+
+
 class Hungary(HolidayBase):
     """
     https://en.wikipedia.org/wiki/Public_holidays_in_Hungary
@@ -56,7 +65,7 @@ class Hungary(HolidayBase):
                     date(year, NOV, 7)
                 ] = "A nagy októberi szocialista forradalom ünnepe"
 
-        easter_date = easter(year)
+        easter_date = _easter(year)
 
         # Good Friday
         if 2017 <= year:
@@ -85,12 +94,11 @@ class Hungary(HolidayBase):
             self[date(year, MAY, 2)] = "A Munka ünnepe"
 
         # State Foundation Day (1771-????, 1891-)
+        aug_20 = date(year, AUG, 20)
         if 1950 <= year <= 1989:
-            self[date(year, AUG, 20)] = "A kenyér ünnepe"
+            self[aug_20] = "A kenyér ünnepe"
         else:
-            self._add_with_observed_day_off(
-                date(year, AUG, 20), "Az államalapítás ünnepe"
-            )
+            self._add_with_observed_day_off(aug_20, "Az államalapítás ünnepe")
 
         # National Day
         if 1991 <= year:
@@ -106,12 +114,10 @@ class Hungary(HolidayBase):
 
         # Christmas Eve is not endorsed officially
         # but nowadays it is usually a day off work
-        if (
-            self.observed
-            and 2010 <= year
-            and not self._is_weekend(year, DEC, 24)
-        ):
-            self[date(year, DEC, 24)] = "Szenteste"
+        if self.observed and 2010 <= year:
+            dec_24 = date(year, DEC, 24)
+            if not self._is_weekend(dec_24):
+                self[dec_24] = "Szenteste"
 
         # First christmas
         self[date(year, DEC, 25)] = "Karácsony"
@@ -129,7 +135,7 @@ class Hungary(HolidayBase):
         # Since 2014, the last day of the year is an observed day off if New
         # Year's Day falls on a Tuesday.
         dec_31 = date(year, DEC, 31)
-        if self.observed and 2014 <= year and self._is_monday(dec_31):
+        if self.observed and 2014 <= year and dec_31.weekday() == MON:
             self[dec_31] = "Szilveszter"
 
     def _add_with_observed_day_off(
@@ -145,9 +151,10 @@ class Hungary(HolidayBase):
         self[day] = desc
         # TODO: should it be a separate flag?
         if self.observed and since <= day.year:
-            if self._is_tuesday(day) and before:
+            weekday = day.weekday()
+            if weekday == TUE and before:
                 self[day + td(days=-1)] = desc + " előtti pihenőnap"
-            elif self._is_thursday(day) and after:
+            elif weekday == THU and after:
                 self[day + td(days=+1)] = desc + " utáni pihenőnap"
 
 
@@ -13,7 +13,7 @@ from datetime import date
 from datetime import timedelta as td
 
 from holidays.constants import JAN, FEB, MAR, APR, MAY, JUN, JUL, AUG, SEP
-from holidays.constants import OCT, NOV, DEC
+from holidays.constants import OCT, NOV, DEC, MON, FRI, SAT, SUN
 from holidays.holiday_base import HolidayBase
 from holidays.utils import _ThaiLuniSolar
 
@@ -241,9 +241,79 @@ class Thailand(HolidayBase):
         2023: ((MAY, 5, thai_bridge_public_holiday),),
     }
 
-    def __init__(self, **kwargs) -> None:
-        self.thls = _ThaiLuniSolar()
-        super().__init__(**kwargs)
+    # Shared by all instances so the lunisolar year cache is reused.
+    thls = _ThaiLuniSolar()
+
+    # Royal Ploughing Ceremony dates as announced by the Royal Palace.
+    # TODO: Update this annually around Dec of each year
+    raeknakhwan_dates = {
+        1997: (MAY, 13),
+        1998: (MAY, 13),
+        # Not held in 1999 date
+        2000: (MAY, 15),
+        2001: (MAY, 16),
+        2002: (MAY, 9),
+        2003: (MAY, 8),
+        2004: (MAY, 7),
+        2005: (MAY, 11),
+        2006: (MAY, 11),
+        2007: (MAY, 10),
+        2008: (MAY, 9),
+        2009: (MAY, 11),
+        2010: (MAY, 10),
+        2011: (MAY, 13),
+        2012: (MAY, 9),
+        2013: (MAY, 13),
+        2014: (MAY, 9),
+        2015: (MAY, 13),
+        2016: (MAY, 9),
+        2017: (MAY, 12),
+        2018: (MAY, 14),
+        2019: (MAY, 9),
+        2020: (MAY, 11),
+        2021: (MAY, 13),
+        2022: (MAY, 17),
+        2023: (MAY, 11),
+    }
+
+    @staticmethod
+    def _is_in_lieu_year(year: int) -> bool:
+        """
+        Returns True if holidays falling on weekends are automatically
+        given an in lieu day in that year. Returns False otherwise.
+        """
+        return 1961 <= year <= 1973 or 1995 <= year <= 1997 or year >= 2001
+
+    def _add_with_observed(
+        self, dt: date, holiday_name: str, in_lieu_active: bool
+    ) -> None:
+        """
+        !!! If Public Holiday falls on weekends, (in lieu) on workday !!!
+        Despite the wording, this usually only applies to Monday only for
+        holidays, consecutive holidays all have their own special in lieu
+        declared separately.
+
+        Data from 1992-1994 and 1998-2000 are declared discretely in
+        special_holidays declarations above.
+
+        Applied Automatically for Monday if on Weekends: 1961-1973
+         **NOTE: No New Year's Eve (in lieu) for this period
+        No In Lieu days available: 1974-1988
+        Case-by-Case application for Workday if on Weekends: 1989-1994
+        Applied Automatically for Workday if on Weekends: 1995-1997
+        Case-by-Case application for Workday if on Weekends: 1998-2000
+        Applied Automatically for Workday if on Weekends: 2001-Present
+        """
+        # TODO: add a check that `dt` is within the populated year for
+        # Islamic holidays which can straddle across gregorian years in
+        # southern region.
+        self[dt] = holiday_name
+
+        if in_lieu_active:
+            weekday = dt.weekday()
+            if self.observed and weekday in self.weekend:
+                in_lieu = dt + td(days=+2 if weekday == SAT else +1)
+                self[in_lieu] = f"{holiday_name} (in lieu)"
 
     def _populate(self, year):
         # Due to Thai Calendar Migration, this is capped off at 1941
@@ -251,35 +321,10 @@ class Thailand(HolidayBase):
         if year <= 1940:
             return None
 
-        def _add_with_observed(dt, holiday_name) -> None:
-            # TODO: add `if dt.year == year` check for Islamic holidays
-            # which can straddle across gregorian years in southern region.
-            self[dt] = holiday_name
-
-            """
-            !!! If Public Holiday falls on weekends, (in lieu) on workday !!!
-            Despite the wording, this usually only applies to Monday only for
-            holidays, consecutive holidays all have their own special in lieu
-            declared separately.
-
-            Data from 1992-1994 and 1998-2000 are declared discretely in
-            special_holidays declarations above.
-
-            Applied Automatically for Monday if on Weekends: 1961-1973
-             **NOTE: No New Year's Eve (in lieu) for this period
-            No In Lieu days available: 1974-1988
-            Case-by-Case application for Workday if on Weekends: 1989-1994
-            Applied Automatically for Workday if on Weekends: 1995-1997
-            Case-by-Case application for Workday if on Weekends: 1998-2000
-            Applied Automatically for Workday if on Weekends: 2001-Present
-            """
-            if 1961 <= year <= 1973 or 1995 <= year <= 1997 or year >= 2001:
-                if self.observed and self._is_weekend(dt):
-                    in_lieu = dt + td(days=+2 if self._is_saturday(dt) else +1)
-                    self[in_lieu] = f"{holiday_name} (in lieu)"
-
         super()._populate(year)
 
+        in_lieu_active = self._is_in_lieu_year(year)
+
         ########################
         #
         # FIXED DATED HOLIDAYS
@@ -292,7 +337,9 @@ class Thailand(HolidayBase):
         # Starts in the present form in 1941 (B.E. 2484)
         # TODO: Add check for 1941 if we support earlier dates.
 
-        _add_with_observed(date(year, JAN, 1), "New Year's Day")
+        self._add_with_observed(
+            date(year, JAN, 1), "New Year's Day", in_lieu_active
+        )
 
         # !!! New Year's Eve (in lieu) !!!
         # วันหยุดชดเชยวันสิ้นปี
@@ -301,13 +348,14 @@ class Thailand(HolidayBase):
         #   go over the next year
         #   - CASE 1: SAT-SUN -> 1 in-lieu on TUE
         #   - CASE 2: SUN-MON -> 1 in-lieu on TUE
-        # See in lieu logic in `_add_with_observed(dt, holiday_name)`
+        # See in lieu logic in `self._add_with_observed` and `_is_in_lieu_year`
         new_years_eve_in_lieu = "New Year's Eve (in lieu)"
 
         if self.observed and (1995 <= year <= 1997 or year >= 2001):
-            if self._is_saturday(date(year - 1, DEC, 31)):
+            weekday = date(year - 1, DEC, 31).weekday()
+            if weekday == SAT:
                 self[date(year, JAN, 3)] = new_years_eve_in_lieu
-            elif self._is_sunday(date(year - 1, DEC, 31)):
+            elif weekday == SUN:
                 self[date(year, JAN, 2)] = new_years_eve_in_lieu
 
         # !!! Chakri Memorial Day !!!
@@ -316,7 +364,9 @@ class Thailand(HolidayBase):
         # Starts in present form in 1918 (B.E. 2461)
         # TODO: Add check for 1918 if we support earlier dates.
 
-        _add_with_observed(date(year, APR, 6), "Chakri Memorial Day")
+        self._add_with_observed(
+            date(year, APR, 6), "Chakri Memorial Day", in_lieu_active
+        )
 
         # !!! Songkran Festival !!!
         # วันสงกรานต์
@@ -338,7 +388,9 @@ class Thailand(HolidayBase):
             self[date(year, APR, 14)] = songkran_festival
             self[date(year, APR, 15)] = songkran_festival
         elif 1957 <= year <= 1988:
-            _add_with_observed(date(year, APR, 13), songkran_festival)
+            self._add_with_observed(
+                date(year, APR, 13), songkran_festival, in_lieu_active
+            )
         elif 1989 <= year <= 1997:
             self[date(year, APR, 12)] = songkran_festival
             self[date(year, APR, 13)] = songkran_festival
@@ -355,7 +407,7 @@ class Thailand(HolidayBase):
         #   - CASE 1: THU-FRI-SAT -> 1 in-lieu on MON
         #   - CASE 2: FRI-SAT-SUN -> 1 in-lieu on MON
         #   - CASE 3: SAT-SUN-MON -> 1 in-lieu on TUE
-        # See in lieu logic in `_add_with_observed(dt, holiday_name)`
+        # See in lieu logic in `self._add_with_observed` and `_is_in_lieu_year`
         # Status: In Use
 
         songkran_festival_in_lieu = "Songkran Festival (in lieu)"
@@ -363,11 +415,10 @@ class Thailand(HolidayBase):
         if self.observed and (1995 <= year <= 1997 or year >= 2001):
             dt = date(year, APR, 15) if year >= 2001 else date(year, APR, 14)
 
-            if self._is_saturday(dt):
+            weekday = dt.weekday()
+            if weekday == SAT:
                 self[dt + td(days=+2)] = songkran_festival_in_lieu
-            elif self._is_sunday(dt):
-                self[dt + td(days=+1)] = songkran_festival_in_lieu
-            elif self._is_monday(dt):
+            elif weekday in {SUN, MON}:
                 self[dt + td(days=+1)] = songkran_festival_in_lieu
 
         # !!! National Labour day !!!
@@ -379,7 +430,9 @@ class Thailand(HolidayBase):
         # *** NOTE: only observed by financial and private sectors
 
         if year >= 1974:
-            _add_with_observed(date(year, MAY, 1), "National Labour Day")
+            self._add_with_observed(
+                date(year, MAY, 1), "National Labour Day", in_lieu_active
+            )
 
         # !!! National Day (24 June) !!!
         # วันชาติ
@@ -389,7 +442,9 @@ class Thailand(HolidayBase):
         # TODO: Add check for 1939 if we support earlier dates.
 
         if year <= 1959:
-            _add_with_observed(date(year, JUN, 24), "National Day")
+            self._add_with_observed(
+                date(year, JUN, 24), "National Day", in_lieu_active
+            )
 
         # !!! Coronation Day !!!
         # วันฉัตรมงคล
@@ -399,9 +454,13 @@ class Thailand(HolidayBase):
         coronation_day = "Coronation Day"
 
         if 1958 <= year <= 2016:
-            _add_with_observed(date(year, MAY, 5), coronation_day)
+            self._add_with_observed(
+                date(year, MAY, 5), coronation_day, in_lieu_active
+            )
         elif year >= 2020:
-            _add_with_observed(date(year, MAY, 4), coronation_day)
+            self._add_with_observed(
+                date(year, MAY, 4), coronation_day, in_lieu_active
+            )
 
         # !!! HM Queen Suthida's Birthday !!!
         # วันเฉลิมพระชนมพรรษา พระราชินี
@@ -409,8 +468,10 @@ class Thailand(HolidayBase):
         # Starts in 2019 (B.E. 2562)
 
         if year >= 2019:
-            _add_with_observed(
-                date(year, JUN, 3), "HM Queen Suthida's Birthday"
+            self._add_with_observed(
+                date(year, JUN, 3),
+                "HM Queen Suthida's Birthday",
+                in_lieu_active,
             )
 
         # !!! HM King Maha Vajiralongkorn's Birthday !!!
@@ -419,8 +480,10 @@ class Thailand(HolidayBase):
         # Started in 2017 (B.E 2560)
 
         if year >= 2017:
-            _add_with_observed(
-                date(year, JUL, 28), "HM King Maha Vajiralongkorn's Birthday"
+            self._add_with_observed(
+                date(year, JUL, 28),
+                "HM King Maha Vajiralongkorn's Birthday",
+                in_lieu_active,
             )
 
         # !!! HM Queen Sirikit the Queen Mother's Birthday !!!
@@ -432,13 +495,16 @@ class Thailand(HolidayBase):
         # Now acts as the Queen Mother from 2017 onwards.
 
         if 1976 <= year <= 2016:
-            _add_with_observed(
-                date(year, AUG, 12), "HM Queen Sirikit's Birthday"
+            self._add_with_observed(
+                date(year, AUG, 12),
+                "HM Queen Sirikit's Birthday",
+                in_lieu_active,
             )
         elif year >= 2017:
-            _add_with_observed(
+            self._add_with_observed(
                 date(year, AUG, 12),
                 "HM Queen Sirikit The Queen Mother's Birthday",
+                in_lieu_active,
             )
 
         # !!! National Mother's Day !!!
@@ -451,9 +517,13 @@ class Thailand(HolidayBase):
         thai_mothers_day = "National Mother's Day"
 
         if 1950 <= year <= 1957:
-            _add_with_observed(date(year, APR, 15), thai_mothers_day)
+            self._add_with_observed(
+                date(year, APR, 15), thai_mothers_day, in_lieu_active
+            )
         elif year >= 1976:
-            _add_with_observed(date(year, AUG, 12), thai_mothers_day)
+            self._add_with_observed(
+                date(year, AUG, 12), thai_mothers_day, in_lieu_active
+            )
 
         # !!! Anniversary for the Death of King Bhumibol Adulyadej !!!
         # วันคล้ายวันสวรรคตพระบาทสมเด็จพระปรมินทร มหาภูมิพลอดุลยเดช บรมนาถบพิตร
@@ -461,8 +531,10 @@ class Thailand(HolidayBase):
         # Started in 2017 (B.E 2560)
 
         if year >= 2017:
-            _add_with_observed(
-                date(year, OCT, 13), "HM King Bhumibol Adulyadej Memorial Day"
+            self._add_with_observed(
+                date(year, OCT, 13),
+                "HM King Bhumibol Adulyadej Memorial Day",
+                in_lieu_active,
             )
 
         # !!! Chulalongkorn Memorial Day !!!
@@ -471,7 +543,9 @@ class Thailand(HolidayBase):
         # Started in 1911 (B.E. 2454)
         # TODO: Add check for 1911 if we support earlier dates.
 
-        _add_with_observed(date(year, OCT, 23), "Chulalongkorn Memorial Day")
+        self._add_with_observed(
+            date(year, OCT, 23), "Chulalongkorn Memorial Day", in_lieu_active
+        )
 
         # !!! HM King Bhumibol Adulyadej's Birthday Anniversary !!!
         # วันเฉลิมพระชนมพรรษา รัชกาลที่ 9 (1960-2016),
@@ -481,8 +555,10 @@ class Thailand(HolidayBase):
         # Confirmed as still in-use in 2017
 
         if year >= 1960:
-            _add_with_observed(
-                date(year, DEC, 5), "HM King Bhumibol Adulyadej's Birthday"
+            self._add_with_observed(
+                date(year, DEC, 5),
+                "HM King Bhumibol Adulyadej's Birthday",
+                in_lieu_active,
             )
 
         # !!! National Father's Day !!!
@@ -493,7 +569,9 @@ class Thailand(HolidayBase):
         #   but it's in the official calendar, so may as well have this here
 
         if year >= 1980:
-            _add_with_observed(date(year, DEC, 5), "National Father's Day")
+            self._add_with_observed(
+                date(year, DEC, 5), "National Father's Day", in_lieu_active
+            )
 
         # !!! Constitution Day !!!
         # วันรัฐธรรมนูญ
@@ -502,7 +580,9 @@ class Thailand(HolidayBase):
         # Last known official record is Bank of Thailand's in 1992 (B.E. 2535)
         # TODO: Add check for 1932 if we support earlier dates.
 
-        _add_with_observed(date(year, DEC, 10), "Constitution Day")
+        self._add_with_observed(
+            date(year, DEC, 10), "Constitution Day", in_lieu_active
+        )
 
         # !!! New Year's Eve !!!
         # วันสิ้นปี
@@ -532,7 +612,9 @@ class Thailand(HolidayBase):
 
         makha_bucha_date = self.thls.makha_bucha_date(year)
         if makha_bucha_date:
-            _add_with_observed(makha_bucha_date, "Makha Bucha")
+            self._add_with_observed(
+                makha_bucha_date, "Makha Bucha", in_lieu_active
+            )
 
         # !!! Visakha Bucha !!!
         # วันวิสาขบูชา
@@ -540,7 +622,9 @@ class Thailand(HolidayBase):
 
         visakha_bucha_date = self.thls.visakha_bucha_date(year)
         if visakha_bucha_date:
-            _add_with_observed(visakha_bucha_date, "Visakha Bucha")
+            self._add_with_observed(
+                visakha_bucha_date, "Visakha Bucha", in_lieu_active
+            )
 
         # !!! Asarnha Bucha !!!
         # วันอาสาฬหบูชา
@@ -567,18 +651,15 @@ class Thailand(HolidayBase):
         #  - CASE 1: FRI-SAT -> 1 in-lieu on MON
         #  - CASE 2: SAT-SUN -> 1 in-lieu on MON
         #  - CASE 3: SUN-MON -> 1 in-lieu on TUE
-        # See in lieu logic in `_add_with_observed(dt, holiday_name)`
-
-        if (
-            asarnha_bucha_date
-            and self.observed
-            and (1961 <= year <= 1973 or 1995 <= year <= 1997 or year >= 2001)
-        ):
-            if self._is_friday(asarnha_bucha_date):
+        # See in lieu logic in `self._add_with_observed` and `_is_in_lieu_year`
+
+        if asarnha_bucha_date and self.observed and in_lieu_active:
+            weekday = asarnha_bucha_date.weekday()
+            if weekday == FRI:
                 self[
                     asarnha_bucha_date + td(days=+3)
                 ] = "Buddhist Lent Day (in lieu)"
-            elif self._is_weekend(asarnha_bucha_date):
+            elif weekday in self.weekend:
                 self[
                     asarnha_bucha_date + td(days=+2)
                 ] = "Asarnha Bucha (in lieu)"
@@ -597,46 +678,20 @@ class Thailand(HolidayBase):
         #   by Court Astrologers; All chosen dates are all around May, so we
         #   can technically assign it to 13 May for years prior with no data.
         # *** NOTE: only observed by government sectors
-        # TODO: Update this annually around Dec of each year
         raeknakhwan = "Royal Ploughing Ceremony"
 
-        raeknakhwan_dates = {
-            1997: (MAY, 13),
-            1998: (MAY, 13),
-            # Not held in 1999 date
-            2000: (MAY, 15),
-            2001: (MAY, 16),
-            2002: (MAY, 9),
-            2003: (MAY, 8),
-            2004: (MAY, 7),
-            2005: (MAY, 11),
-            2006: (MAY, 11),
-            2007: (MAY, 10),
-            2008: (MAY, 9),
-            2009: (MAY, 11),
-            2010: (MAY, 10),
-            2011: (MAY, 13),
-            2012: (MAY, 9),
-            2013: (MAY, 13),
-            2014: (MAY, 9),
-            2015: (MAY, 13),
-            2016: (MAY, 9),
-            2017: (MAY, 12),
-            2018: (MAY, 14),
-            2019: (MAY, 9),
-            2020: (MAY, 11),
-            2021: (MAY, 13),
-            2022: (MAY, 17),
-            2023: (MAY, 11),
-        }
         # For years with exact date data
-        if year in raeknakhwan_dates:
-            _add_with_observed(
-                date(year, *raeknakhwan_dates[year]), raeknakhwan
+        if year in self.raeknakhwan_dates:
+            self._add_with_observed(
+                date(year, *self.raeknakhwan_dates[year]),
+                raeknakhwan,
+                in_lieu_active,
             )
         # Approx. otherwise for 1957-2013
         elif 1957 <= year <= 1996:
-            _add_with_observed(date(year, MAY, 13), raeknakhwan)
+            self._add_with_observed(
+                date(year, MAY, 13), raeknakhwan, in_lieu_active
+            )
 
 
 class TH(Thailand):
@@ -22,6 +22,10 @@ class TestThailand(TestCase):
     def test_country_aliases(self):
         self.assertCountryAliases(Thailand, TH, THA)
 
+    def test_instances_share_lunisolar_calendar(self):
+        self.assertIs(Thailand().thls, TH().thls)
+        self.assertEqual(Thailand(years=2022), Thailand(years=2022))
+
     def test_no_holidays(self):
         self.assertNoHolidays(Thailand(years=1940))
 